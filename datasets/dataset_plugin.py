@@ -4,7 +4,18 @@ import dataclasses
 import logging
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Callable, Dict, Iterable, Optional, Tuple, Type, Union
+from typing import (
+    Callable,
+    ClassVar,
+    Collection,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
 
 from datasets._typing import ColumnNames, DataFrameType
 from datasets.context import Context
@@ -17,9 +28,19 @@ from .program_executor import ProgramExecutor
 _logger = logging.getLogger(__name__)
 _logger.setLevel(logging.DEBUG)
 
+# Context[name] goes through the Enum metaclass on every call
+_CONTEXTS_BY_NAME: Dict[str, Context] = dict(Context.__members__)
+
 
 @dataclass
 class StorageOptions:
+    # subclasses by lower-cased class name, used to decode the JSON "type" field
+    _types_by_name: ClassVar[Dict[str, Type[StorageOptions]]] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        StorageOptions._types_by_name[cls.__name__.lower()] = cls
+
     def to_json(self) -> dict:
         ret = dataclasses.asdict(self, dict_factory=lambda x: {k: v for (k, v) in x if v is not None})
         ret["type"] = type(self).__name__
@@ -40,7 +61,7 @@ class DatasetPlugin(ABC):
 
     _executor: ProgramExecutor
     _plugins: Dict[Type[StorageOptions], DatasetPlugin] = {}
-    _META_COLUMNS = ["run_id", "run_time"]
+    _META_COLUMNS: Tuple[str, ...] = ("run_id", "run_time")
 
     _dataset_name_validator: Callable[[str], None]
     _dataset_plugin_factory: DatasetPluginFactory
@@ -72,6 +93,7 @@ class DatasetPlugin(ABC):
         self.key = logical_key  # TODO: validate this too!
         self.mode: Mode = mode if isinstance(mode, Mode) else Mode[mode]
         self.columns = columns
+        self._read_columns: Optional[Tuple[str, ...]] = _to_column_tuple(columns)
         self.run_id = run_id
         self.run_time = run_time
         self.options = options
@@ -130,29 +152,46 @@ class DatasetPlugin(ABC):
     @classmethod
     def _get_context(cls, context: Optional[Union[Context, str]] = None) -> Context:
         if context:
-            return context if isinstance(context, Context) else Context[context]
+            return context if isinstance(context, Context) else _CONTEXTS_BY_NAME[context]
         else:
             return cls._executor.context
 
     @classmethod
     def _validate_register_parameters(
         cls,
+        wrapped_class: DatasetPlugin,
         context=Context.BATCH,
         options_type: Optional[Type[StorageOptions]] = None,
         as_default_context_plugin=False,
-    ):
+    ) -> Tuple[Context, ...]:
+        """
+        Validates the whole registration before anything is registered.
+        Re-registering the same class is allowed, registering a different one is an error.
+
+        :return: The single contexts to register a default context plugin under.
+        """
         if context is None:
             raise ValueError("context cannot be None!")
 
         if not isinstance(context, Context):
             raise ValueError(f"{context=} is not of type(Context)!")
 
-        if as_default_context_plugin and context in cls._default_context_plugins:
-            raise ValueError(f"{context=} already registered in {cls._default_context_plugins=}")
-
-        if options_type in cls._plugins:
+        # lookups are by a single context, so e.g. Context.ONLINE | Context.STREAMING registers both
+        context_members = _context_members(context)
+        if as_default_context_plugin:
+            for context_member in context_members:
+                existing = cls._default_context_plugins.get(context_member)
+                if existing is not None and existing is not wrapped_class:
+                    raise ValueError(
+                        f"{context_member=} already registered in {cls._default_context_plugins=}"
+                    )
+
+        existing = cls._plugins.get(options_type)
+        if existing is not None and existing is not wrapped_class:
             raise ValueError(f"{options_type=} already registered in {cls._plugins=}")
 
+        return context_members
+
     @classmethod
     def register(
         cls,
@@ -160,11 +199,14 @@ class DatasetPlugin(ABC):
         options_type: Optional[Type[StorageOptions]] = None,
         as_default_context_plugin: bool = False,
     ) -> Callable:
-        cls._validate_register_parameters(context, options_type, as_default_context_plugin)
-
         def inner_wrapper(wrapped_class: DatasetPlugin) -> DatasetPlugin:
+            context_members = cls._validate_register_parameters(
+                wrapped_class, context, options_type, as_default_context_plugin
+            )
+
             if as_default_context_plugin:
-                cls._default_context_plugins[context] = wrapped_class
+                for context_member in context_members:
+                    cls._default_context_plugins[context_member] = wrapped_class
 
             if options_type:
                 cls._plugins[options_type] = wrapped_class
@@ -184,21 +226,24 @@ class DatasetPlugin(ABC):
         options: Optional[StorageOptions] = None,
         options_by_context: Optional[Dict[Context, StorageOptions]] = None,
     ) -> Tuple[DatasetPlugin, Optional[StorageOptions]]:
-        context_lookup: Context = DatasetPlugin._get_context(context)
-
         if options is None and options_by_context is None:
-            return (cls._default_context_plugins[context_lookup], None)
+            return (cls._default_context_plugins[DatasetPlugin._get_context(context)], None)
         elif options and options_by_context:
             raise ValueError("Please set one of options or options_by_context, not both.")
         elif options:
-            if type(options) not in cls._plugins:
+            # the plugin is keyed by the options type alone, no context resolution is needed
+            plugin = cls._plugins.get(type(options))
+            if plugin is None:
                 raise ValueError(f"{type(options)=} not in {cls._plugins=}")
-            return (cls._plugins[type(options)], options)
+            return (plugin, options)
         elif options_by_context:
-            if context_lookup not in options_by_context:
+            context_lookup: Context = DatasetPlugin._get_context(context)
+            context_options = options_by_context.get(context_lookup)
+            if context_options is None:
                 raise ValueError(f"{context_lookup=} not in {options_by_context=}")
-            context_options = options_by_context[context_lookup]
-            plugin = cls._plugins[type(context_options)]
+            plugin = cls._plugins.get(type(context_options))
+            if plugin is None:
+                raise ValueError(f"{type(context_options)=} not in {cls._plugins=}")
             return (plugin, context_options)
         else:
             raise ValueError("Either options or options_by_context must be set")
@@ -221,11 +266,30 @@ class DatasetPlugin(ABC):
         else:
             pass
 
-    def _get_read_columns(self, columns: Optional[ColumnNames] = None) -> Optional[Iterable[str]]:
-        read_columns = columns if columns else self.columns
-        if read_columns is not None and isinstance(read_columns, str):
-            read_columns = read_columns.split(",")
-        return read_columns
+    def _get_read_columns(self, columns: Optional[ColumnNames] = None) -> Optional[List[str]]:
+        read_columns = _to_column_tuple(columns) if columns else self._read_columns
+        # a new list each call, callers may append meta columns to it
+        return list(read_columns) if read_columns is not None else None
+
+    @classmethod
+    def _get_meta_columns_to_drop(
+        cls, columns: Collection[str], read_columns: Optional[Iterable[str]] = None
+    ) -> List[str]:
+        """
+        The meta columns present in columns that were not explicitly requested in read_columns.
+        """
+        requested = frozenset(read_columns) if read_columns is not None else frozenset()
+        return [c for c in cls._META_COLUMNS if c not in requested and c in columns]
 
     def __repr__(self):
         return f"Dataset({self.name=},{self.mode=},{self.key=},{self.columns=})"
+
+
+def _to_column_tuple(columns: Optional[ColumnNames]) -> Optional[Tuple[str, ...]]:
+    if columns is None:
+        return None
+    return tuple(columns.split(",")) if isinstance(columns, str) else tuple(columns)
+
+
+def _context_members(context: Context) -> Tuple[Context, ...]:
+    return tuple(member for member in Context if member & context)
@@ -1,7 +1,7 @@
 import dataclasses
 import json
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Type, Union
+from typing import Dict, Optional, Union
 
 from metaflow._vendor.click import ParamType
 from metaflow.parameters import Parameter
@@ -20,10 +20,9 @@ class _DatasetTypeClass(ParamType):
         if isinstance(value, str):
             params: _DatasetParams = json.loads(value, cls=_DatasetParamsDecoder)
             params_dict = params.__dict__.copy()
-            if "context" in params_dict:
-                del params_dict["context"]
+            context = params_dict.pop("context", None)
             return DatasetPlugin.factory(
-                context=params.context if params.context else DatasetPlugin._executor.context, **params_dict
+                context=context if context else DatasetPlugin._executor.context, **params_dict
             )
         else:
             return value
@@ -63,32 +62,12 @@ class _DatasetParamsDecoder(json.JSONDecoder):
     def __init__(self, *args, **kwargs):
         json.JSONDecoder.__init__(self, object_hook=self.object_hook, *args, **kwargs)
 
-    @staticmethod
-    def get_storage_subclasses(cls: object) -> list[Type[StorageOptions]]:
-        ret: List[Type] = []
-
-        for subclass in cls.__subclasses__():
-            ret.append(subclass)
-            ret.extend(_DatasetParamsDecoder.get_storage_subclasses(subclass))
-
-        return ret
-
     def object_hook(self, obj: dict) -> Union[_DatasetParams, StorageOptions]:
-        type = obj.get("type")
+        # remove "type"
+        type = obj.pop("type", None)
         if type:
-            # remove "type"
-            del obj["type"]
-
-            mapping: Dict[str, Type[StorageOptions]] = {
-                f.__name__.lower(): f for f in _DatasetParamsDecoder.get_storage_subclasses(StorageOptions)
-            }
-
-            return mapping[type.lower()](**obj)
-        elif (
-            "options" not in obj
-            and len(obj.keys())
-            and all(isinstance(v, StorageOptions) for v in obj.values())
-        ):
+            return StorageOptions._types_by_name[type.lower()](**obj)
+        elif "options" not in obj and obj and all(isinstance(v, StorageOptions) for v in obj.values()):
             return {DatasetPlugin._get_context(k): v for k, v in obj.items()}
         else:
             mode = obj.get("mode")
@@ -22,7 +22,7 @@ from datasets.utils.case_utils import pascal_to_snake_case
 _logger = logging.getLogger(__name__)
 
 if TYPE_CHECKING:
-    from pyspark import SparkConf
+    from pyspark import SparkConf, pandas as ps
     from pyspark.sql import SparkSession
 
 
@@ -60,7 +60,10 @@ class BatchBasePlugin(DatasetPlugin, dict):
         if self.hive_table_name is None:
             self.hive_table_name = pascal_to_snake_case(name)
 
+        self._partition_cols: Tuple[str, ...] = tuple(BatchBasePlugin._to_partition_list(self.partition_by))
+
         self._path: Optional[str] = None
+        self._dataset_func_path: Optional[str] = None
         super(BatchBasePlugin, self).__init__(
             name=name,
             logical_key=logical_key,
@@ -112,17 +115,18 @@ class BatchBasePlugin(DatasetPlugin, dict):
 
         return filters, read_columns
 
-    def _partition_by_to_list(self, partition_by: Optional[ColumnNames] = None) -> List[str]:
-        def to_list(partitions: Optional[ColumnNames]) -> List[str]:
-            if partitions:
-                if isinstance(partitions, str):
-                    return partitions.split(",")
-                else:
-                    return partitions
-            else:
-                return list()
+    @staticmethod
+    def _to_partition_list(partition_by: Optional[ColumnNames]) -> List[str]:
+        if partition_by:
+            return partition_by.split(",") if isinstance(partition_by, str) else list(partition_by)
+        else:
+            return list()
 
-        return to_list(partition_by) if partition_by else to_list(self.partition_by)
+    def _partition_by_to_list(self, partition_by: Optional[ColumnNames] = None) -> List[str]:
+        # always a new list, callers append run_id/run_time to it
+        if partition_by:
+            return BatchBasePlugin._to_partition_list(partition_by)
+        return list(self._partition_cols)
 
     def _write_data_frame_prep(
         self,
@@ -140,10 +144,22 @@ class BatchBasePlugin(DatasetPlugin, dict):
 
                 df = df.withColumn(name, lit(value))
             else:
-                df[name] = value
+                import pandas as pd
+
+                if isinstance(df, pd.DataFrame):
+                    # constant partition value: one int8 code per row rather than an object per row
+                    import numpy as np
+
+                    df[name] = pd.Categorical.from_codes(np.zeros(len(df), dtype=np.int8), categories=[value])
+                else:
+                    df[name] = value
 
             return df
 
+        if self._path is self._dataset_func_path and {"run_id", "run_time"}.intersection(partition_cols):
+            # _dataset_path_func may depend on the run_id and run_time assigned below
+            self._path = self._dataset_func_path = None
+
         if "run_id" in partition_cols:
             self.run_id = self._executor.current_run_id  # DO NOT ALLOW OVERWRITE OF ANOTHER RUN ID
             df = add_column(df, "run_id", self.run_id)
@@ -154,6 +170,26 @@ class BatchBasePlugin(DatasetPlugin, dict):
 
         return df, partition_cols
 
+    def to_spark_pandas(
+        self,
+        columns: Optional[str] = None,
+        run_id: Optional[str] = None,
+        run_time: Optional[int] = None,
+        conf: Optional["SparkConf"] = None,
+        partitions: Optional[dict] = None,
+        **kwargs,
+    ) -> "ps.DataFrame":
+        return self.to_spark(
+            columns=columns, run_id=run_id, run_time=run_time, conf=conf, partitions=partitions, **kwargs
+        ).to_pandas_on_spark(index_col=kwargs.get("index_col", None))
+
+    def write_spark_pandas(self, df: "ps.DataFrame", partition_by: Optional[ColumnNames] = None, **kwargs):
+        self.write_spark(
+            df.to_spark(index_col=kwargs.get("index_col", None)),
+            partition_by=partition_by,
+            **kwargs,
+        )
+
     @staticmethod
     def _get_spark_builder(conf: "Optional[SparkConf]" = None) -> "SparkSession.Builder":
         from pyspark import SparkConf
@@ -172,15 +208,16 @@ class BatchBasePlugin(DatasetPlugin, dict):
             return self._path
 
         if BatchBasePlugin._dataset_path_func:
-            return BatchBasePlugin._dataset_path_func(self)
+            self._path = self._dataset_func_path = BatchBasePlugin._dataset_path_func(self)
+            return self._path
 
         if self.program_name is None:
             self.program_name = self._executor.current_program_name
 
-        path = os.path.join(
+        self._path = os.path.join(
             self._executor.datastore_path,
             "datastore",
             self.program_name,
             self.hive_table_name,
         )
-        return path
+        return self._path
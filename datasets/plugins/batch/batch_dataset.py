@@ -1,8 +1,6 @@
 import logging
 from typing import TYPE_CHECKING, List, Optional, Tuple, Union
 
-import pandas as pd
-
 from datasets import Mode
 from datasets._typing import ColumnNames, DataFrameType
 from datasets.context import Context
@@ -19,6 +17,7 @@ _logger.setLevel(logging.INFO)
 
 if TYPE_CHECKING:
     import dask.dataframe as dd
+    import pandas as pd
     from pyspark import SparkConf, pandas as ps
     from pyspark.sql import DataFrame as SparkDataFrame
 
@@ -56,19 +55,6 @@ class BatchDataset(BatchBasePlugin):
             if options.path:
                 self["path"] = options.path
 
-    def to_spark_pandas(
-        self,
-        columns: Optional[str] = None,
-        run_id: Optional[str] = None,
-        run_time: Optional[int] = None,
-        conf: Optional["SparkConf"] = None,
-        partitions: Optional[dict] = None,
-        **kwargs,
-    ) -> "ps.DataFrame":
-        return self.to_spark(
-            columns=columns, run_id=run_id, run_time=run_time, conf=conf, partitions=partitions, **kwargs
-        ).to_pandas_on_spark(index_col=kwargs.get("index_col", None))
-
     def to_pandas(
         self,
         columns: Optional[str] = None,
@@ -77,10 +63,12 @@ class BatchDataset(BatchBasePlugin):
         storage_format: str = "parquet",
         partitions: Optional[dict] = None,
         **kwargs,
-    ) -> pd.DataFrame:
+    ) -> "pd.DataFrame":
         if not (self.mode & Mode.READ):
             raise InvalidOperationException(f"Cannot read because mode={self.mode}")
 
+        import pandas as pd
+
         filters, read_columns = self._get_filters_columns(columns, run_id, run_time, partitions)
         self._path = self._get_dataset_path()
         _logger.info(
@@ -97,15 +85,21 @@ class BatchDataset(BatchBasePlugin):
                 **kwargs,
             )
         elif storage_format == "csv":
-            df = pd.read_csv(self._path, usecols=read_columns, **kwargs)
+            # skip parsing meta columns that were not requested
+            usecols = read_columns if read_columns is not None else self._is_not_meta_column
+            df = pd.read_csv(self._path, usecols=usecols, **kwargs)
         else:
             raise ValueError(f"{storage_format=} not supported.")
 
-        for meta_column in self._META_COLUMNS:
-            if meta_column in df and (read_columns is None or meta_column not in read_columns):
-                del df[meta_column]
+        meta_columns = self._get_meta_columns_to_drop(df.columns, read_columns)
+        if meta_columns:
+            df.drop(columns=meta_columns, inplace=True)
         return df
 
+    @classmethod
+    def _is_not_meta_column(cls, column: str) -> bool:
+        return column not in cls._META_COLUMNS
+
     def to_dask(
         self,
         columns: Optional[str] = None,
@@ -166,12 +160,14 @@ class BatchDataset(BatchBasePlugin):
             for name, op, val in filters:
                 df = df.where(df[name] == val)
 
-        for meta_column in self._META_COLUMNS:
-            if meta_column in df.columns and (read_columns is None or meta_column not in read_columns):
-                df = df.drop(meta_column)
+        meta_columns = self._get_meta_columns_to_drop(df.columns, read_columns)
+        if meta_columns:
+            df = df.drop(*meta_columns)
         return df
 
-    def write(self, data: Union[pd.DataFrame, "ps.DataFrame", "SparkDataFrame", "dd.DataFrame"], **kwargs):
+    def write(self, data: Union["pd.DataFrame", "ps.DataFrame", "SparkDataFrame", "dd.DataFrame"], **kwargs):
+        import pandas as pd
+
         if isinstance(data, pd.DataFrame):
             return self.write_pandas(data, **kwargs)
         elif "pyspark.pandas.frame.DataFrame" in str(type(data)):
@@ -218,7 +214,7 @@ class BatchDataset(BatchBasePlugin):
             **kwargs,
         )
 
-    def write_pandas(self, df: pd.DataFrame, partition_by: Optional[ColumnNames] = None, **kwargs):
+    def write_pandas(self, df: "pd.DataFrame", partition_by: Optional[ColumnNames] = None, **kwargs):
         df, partition_cols = self._path_write_data_frame_prep(df, partition_by=partition_by)
         self._path = self._get_dataset_path()
         _logger.info(f"write_pandas({self._path=}, {partition_cols=})")
@@ -231,13 +227,6 @@ class BatchDataset(BatchBasePlugin):
             **kwargs,
         )
 
-    def write_spark_pandas(self, df: "ps.DataFrame", partition_by: Optional[ColumnNames] = None, **kwargs):
-        self.write_spark(
-            df.to_spark(index_col=kwargs.get("index_col", None)),
-            partition_by=partition_by,
-            **kwargs,
-        )
-
     def write_spark(self, df: "SparkDataFrame", partition_by: Optional[ColumnNames] = None, **kwargs):
         df, partition_cols = self._path_write_data_frame_prep(df, partition_by=partition_by)
         self._path = self._get_dataset_path()
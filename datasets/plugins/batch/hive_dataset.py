@@ -5,8 +5,6 @@ from dataclasses import dataclass
 from functools import partial
 from typing import TYPE_CHECKING, Callable, List, Optional, Union
 
-import pandas as pd
-
 from datasets._typing import ColumnNames
 from datasets.context import Context
 from datasets.dataset_plugin import DatasetPlugin
@@ -26,6 +24,7 @@ _logger = logging.getLogger(__name__)
 _logger.setLevel(logging.INFO)
 
 if TYPE_CHECKING:
+    import pandas as pd
     from pyspark import SparkConf, pandas as ps
     from pyspark.sql import DataFrame as SparkDataFrame, SparkSession
 
@@ -73,19 +72,6 @@ class HiveDataset(BatchBasePlugin):
             columns=columns, run_id=run_id, run_time=run_time, conf=conf, partitions=partitions, **kwargs
         )
 
-    def to_spark_pandas(
-        self,
-        columns: Optional[str] = None,
-        run_id: Optional[str] = None,
-        run_time: Optional[int] = None,
-        conf: Optional["SparkConf"] = None,
-        partitions: Optional[dict] = None,
-        **kwargs,
-    ) -> "ps.DataFrame":
-        return self.to_spark(
-            columns=columns, run_id=run_id, run_time=run_time, conf=conf, partitions=partitions, **kwargs
-        ).to_pandas_on_spark(index_col=kwargs.get("index_col", None))
-
     def to_spark(
         self,
         columns: Optional[str] = None,
@@ -120,12 +106,14 @@ class HiveDataset(BatchBasePlugin):
             for name, _, val in filters:
                 df = df.filter(df[name] == val)
 
-        for meta_column in self._META_COLUMNS:
-            if meta_column in df.columns and (read_columns is None or meta_column not in read_columns):
-                df = df.drop(meta_column)
+        meta_columns = self._get_meta_columns_to_drop(df.columns, read_columns)
+        if meta_columns:
+            df = df.drop(*meta_columns)
         return df
 
-    def write(self, data: Union[pd.DataFrame, "ps.DataFrame", "SparkDataFrame"], **kwargs):
+    def write(self, data: Union["pd.DataFrame", "ps.DataFrame", "SparkDataFrame"], **kwargs):
+        import pandas as pd
+
         if isinstance(data, pd.DataFrame):
             from pyspark import pandas as ps
 
@@ -139,20 +127,14 @@ class HiveDataset(BatchBasePlugin):
                 f"data is of unsupported type {type(data)=}. Maybe PySpark/Dask is not installed?"
             )
 
-    def write_spark_pandas(self, df: "ps.DataFrame", partition_by: Optional[ColumnNames] = None, **kwargs):
-        self.write_spark(
-            df.to_spark(index_col=kwargs.get("index_col", None)),
-            partition_by=partition_by,
-            **kwargs,
-        )
-
     @staticmethod
     def _validate_columns(df: "SparkDataFrame"):
         # column names are alphanumeric and underscore
         #  HIVE-10120 Disallow create table with dot/colon in column name
         #  https://stackoverflow.com/a/55337025
         for column_name in df.columns:
-            if not all(c.isalnum() or c == "_" for c in column_name):
+            stripped_name = column_name.replace("_", "")
+            if stripped_name and not stripped_name.isalnum():
                 raise ValueError(f"{column_name} is not alphanum or underscore!")
 
     def write_spark(
@@ -224,7 +206,7 @@ class HiveDataset(BatchBasePlugin):
             _logger.info(f"{self.hive_table_name=} does not exist: creating {path=}!")
             (
                 df.write.mode("append")
-                .option("path", self._get_dataset_path())
+                .option("path", path)
                 .partitionBy(partition_cols)
                 .options(**kwargs)
                 .saveAsTable(self.hive_table_name)
@@ -5,14 +5,17 @@ from datasets.plugins import MetaflowExecutor
 def register():
     from importlib_metadata import entry_points
 
+    # Scan the installed distributions' metadata once for both groups
+    eps = entry_points()
+
     # Register plugins
-    for entry in entry_points(group="datasets.plugins"):
+    for entry in eps.select(group="datasets.plugins"):
         entry.load()
 
     # Register default executor first
     DatasetPlugin.register_executor(executor=MetaflowExecutor())
 
-    for entry in entry_points(group="datasets.executors"):
+    for entry in eps.select(group="datasets.executors"):
         executor = entry.load()
         if not isinstance(executor, type(MetaflowExecutor)):
             DatasetPlugin.register_executor(executor=executor)
@@ -3,6 +3,7 @@ import os
 import time
 import uuid
 from pathlib import Path
+from typing import Iterator
 
 import pytest
 from pyspark.sql import SparkSession
@@ -75,3 +76,11 @@ def spark_session():
     logger = logging.getLogger("py4j")
     logger.setLevel(logging.WARN)
     return spark_session
+
+
+@pytest.fixture(scope="session")
+def hive_test_db(spark_session: SparkSession) -> Iterator[str]:
+    """Fixture for creating the test_db Hive database once per test session."""
+    spark_session.sql("create database if not exists test_db")
+    yield "test_db"
+    spark_session.sql("drop database if exists test_db cascade")
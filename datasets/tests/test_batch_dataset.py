@@ -136,6 +136,16 @@ def test_default_plugin_pandas_csv(dataset: BatchDataset, df: pd.DataFrame):
     shutil.rmtree(csv_path, ignore_errors=True)
 
 
+@pytest.mark.parametrize("path", [csv_path])
+def test_default_plugin_pandas_csv_drops_meta_columns(dataset: BatchDataset, df: pd.DataFrame):
+    df.assign(run_id="my_run_id", run_time=1).to_csv(csv_path, index=False)
+    read_df = dataset.to_pandas(storage_format="csv")
+    os.remove(csv_path)
+
+    assert read_df.columns.to_list() == ["col1", "col2", "col3"]
+    assert_frame_equal(df, read_df)
+
+
 def test_to_pandas_unsupported_format(dataset: BatchDataset):
     with pytest.raises(ValueError) as exec_info:
         dataset.to_pandas(storage_format="foo")
@@ -165,6 +175,22 @@ def test_get_dataset_path(dataset: BatchDataset, df: pd.DataFrame):
     shutil.rmtree(path)
 
 
+@pytest.mark.parametrize("path", [None])
+@pytest.mark.parametrize("partition_by", [["col1"]])
+@pytest.mark.parametrize("name", ["DsPartitionByList"])
+def test_write_does_not_mutate_partition_by(dataset: BatchDataset, df: pd.DataFrame):
+    partition_by = dataset.options.partition_by
+    dataset.write(df.copy())
+    assert partition_by == ["col1"]
+    assert dataset.partition_by == ["col1"]
+
+    write_partition_by = ["col3"]
+    dataset.write(df.copy(), partition_by=write_partition_by)
+    assert write_partition_by == ["col3"]
+
+    shutil.rmtree(dataset._get_dataset_path())
+
+
 @pytest.mark.parametrize("mode", [Mode.READ])
 def test_write_on_read_only_pandas(dataset: BatchDataset):
     df = pd.DataFrame({"col1": ["A", "A", "A", "B", "B", "B"], "col2": [1, 2, 3, 4, 5, 6]})
@@ -217,6 +243,34 @@ def test_to_spark(dataset: BatchDataset, df: pd.DataFrame, spark_session):
     assert df2["col3"].unique().tolist() == ["A1", "A2"]
 
 
+def test_get_read_columns_copies_columns(name: str, path: str, mode: Mode):
+    columns = ["col1", "col2"]
+    dataset = Dataset(name=name, columns=columns, mode=mode, options=BatchOptions(path=path))
+
+    read_columns = dataset._get_read_columns()
+    read_columns.append("run_id")
+
+    assert columns == ["col1", "col2"]
+    assert dataset._get_read_columns() == ["col1", "col2"]
+
+
+@pytest.mark.parametrize("path", [None])
+@pytest.mark.parametrize("name", ["DsSparkColumns"])
+@pytest.mark.spark
+def test_to_spark_does_not_mutate_columns(
+    name: str, path: str, mode: Mode, run_id: str, df: pd.DataFrame, spark_session
+):
+    columns = ["col1", "col2"]
+    dataset = Dataset(name=name, columns=columns, run_id=run_id, mode=mode, options=BatchOptions(path=path))
+    dataset.write(df.copy())
+
+    dataset.to_spark()
+    assert dataset.to_spark().columns == ["col1", "col2", "run_id", "run_time"]
+    assert columns == ["col1", "col2"]
+
+    shutil.rmtree(dataset._get_dataset_path())
+
+
 @pytest.mark.spark
 @pytest.mark.parametrize("mode", [Mode.READ])
 def test_write_on_read_only_spark(dataset: BatchDataset):
@@ -278,3 +332,26 @@ def test_register_dataset_path_plugin(dataset: BatchDataset, df: pd.DataFrame):
     assert path.endswith("fee_foo")
 
     BatchDataset.register_dataset_path_func(None)
+
+
+@pytest.mark.parametrize("path", [None])
+@pytest.mark.parametrize("name", ["DsPathFunc"])
+def test_dataset_path_func_after_write(dataset: BatchDataset, df: pd.DataFrame, data_path: str, run_id: str):
+    path_func_root = os.path.join(data_path, "path_func")
+
+    def test_dataset_path_func(passed_dataset: BatchDataset) -> str:
+        return os.path.join(path_func_root, str(passed_dataset.run_id))
+
+    BatchDataset.register_dataset_path_func(test_dataset_path_func)
+
+    assert dataset._get_dataset_path() == os.path.join(path_func_root, "None")
+    dataset.write(df.copy())
+    assert dataset._get_dataset_path() == os.path.join(path_func_root, run_id)
+
+    # an explicitly set path is not replaced by the function
+    dataset._path = os.path.join(path_func_root, "explicit")
+    dataset.write(df.copy())
+    assert dataset._get_dataset_path() == os.path.join(path_func_root, "explicit")
+
+    BatchDataset.register_dataset_path_func(None)
+    shutil.rmtree(path_func_root)
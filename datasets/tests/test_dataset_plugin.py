@@ -45,17 +45,14 @@ class DatasetTestOptions(StorageOptions):
 
 @DatasetPlugin.register(context=Context.BATCH, options_type=DatasetTestOptions)
 class DatasetPluginTest(_TestPlugin):
-    db = pd.DataFrame(
-        {"key": ["first", "second", "third", "fourth"], "value": [1, 2, 3, 4]},
-    )
-    db.set_index("key")
+    db = {"first": 1, "second": 2, "third": 3, "fourth": 4}
 
     def __init__(self, name: str, options: DatasetTestOptions, **kwargs):
         self.a = options.a
         super(DatasetPluginTest, self).__init__(name=name, options=options, **kwargs)
 
     def to_pandas(self, key) -> pd.DataFrame:
-        return self.db[self.db.key.isin(key)]
+        return pd.DataFrame({"key": key, "value": [self.db[k] for k in key]})
 
 
 @dataclass
@@ -153,6 +150,16 @@ def test_dataset_json_constructor():
     assert isinstance(dataset, FeeOnlineDatasetPluginTest)
 
 
+def test_dataset_json_constructor_does_not_share_state():
+    value = '{"name": "FooName", "columns": ["key"], "options":{"type": "DatasetTestOptions", "a": "Foo"}}'
+    dataset1 = _DatasetTypeClass().convert(value, None, None)
+    dataset2 = _DatasetTypeClass().convert(value, None, None)
+
+    assert dataset1.options == dataset2.options
+    assert dataset1.options is not dataset2.options
+    assert dataset1.columns is not dataset2.columns
+
+
 def test_dataset_factory_constructor_unhappy():
     @dataclass
     class UnHappyOptions(StorageOptions):
@@ -255,6 +262,84 @@ def test_register_plugin():
     assert "is not of type(Context)" in str(execinfo.value)
 
 
+def test_register_default_plugin_multiple_contexts(monkeypatch):
+    monkeypatch.setattr(DatasetPlugin, "_default_context_plugins", {})
+
+    @DatasetPlugin.register(context=Context.ONLINE | Context.STREAMING, as_default_context_plugin=True)
+    class FooPlugin(_TestPlugin):
+        def __init__(self, **kwargs):
+            super(FooPlugin, self).__init__(**kwargs)
+
+    assert DatasetPlugin._default_context_plugins == {Context.ONLINE: FooPlugin, Context.STREAMING: FooPlugin}
+
+    dataset = Dataset("Foo", context=Context.STREAMING)
+    assert isinstance(dataset, FooPlugin)
+
+
+def test_register_plugin_conflict_registers_nothing(monkeypatch):
+    monkeypatch.setattr(DatasetPlugin, "_plugins", dict(DatasetPlugin._plugins))
+    default_context_plugins = dict(DatasetPlugin._default_context_plugins)
+    monkeypatch.setattr(DatasetPlugin, "_default_context_plugins", default_context_plugins)
+
+    @dataclass
+    class FooOptions(StorageOptions):
+        pass
+
+    with pytest.raises(ValueError) as execinfo:
+        # STREAMING already has a default plugin
+        @DatasetPlugin.register(
+            context=Context.BATCH | Context.STREAMING, options_type=FooOptions, as_default_context_plugin=True
+        )
+        class FooPlugin(_TestPlugin):
+            pass
+
+    assert "already registered" in str(execinfo.value)
+    assert FooOptions not in DatasetPlugin._plugins
+    assert isinstance(Dataset("Foo", context=Context.BATCH), HiveDataset)
+
+
+def test_register_same_plugin_twice(monkeypatch):
+    monkeypatch.setattr(DatasetPlugin, "_plugins", dict(DatasetPlugin._plugins))
+    monkeypatch.setattr(DatasetPlugin, "_default_context_plugins", {})
+
+    @dataclass
+    class FooOptions(StorageOptions):
+        pass
+
+    register = DatasetPlugin.register(
+        context=Context.ONLINE | Context.STREAMING, options_type=FooOptions, as_default_context_plugin=True
+    )
+
+    @register
+    class FooPlugin(_TestPlugin):
+        pass
+
+    plugins = dict(DatasetPlugin._plugins)
+    default_context_plugins = dict(DatasetPlugin._default_context_plugins)
+
+    # e.g. a module that is imported twice
+    assert register(FooPlugin) is FooPlugin
+    assert DatasetPlugin._plugins == plugins
+    assert DatasetPlugin._default_context_plugins == default_context_plugins
+    assert DatasetPlugin._plugins[FooOptions] is FooPlugin
+    assert default_context_plugins == {Context.ONLINE: FooPlugin, Context.STREAMING: FooPlugin}
+
+    class BarPlugin(_TestPlugin):
+        pass
+
+    with pytest.raises(ValueError) as execinfo:
+        DatasetPlugin.register(context=Context.BATCH, options_type=FooOptions)(BarPlugin)
+
+    assert "already registered" in str(execinfo.value)
+
+    with pytest.raises(ValueError) as execinfo:
+        DatasetPlugin.register(context=Context.STREAMING, as_default_context_plugin=True)(BarPlugin)
+
+    assert "already registered" in str(execinfo.value)
+    assert DatasetPlugin._plugins == plugins
+    assert DatasetPlugin._default_context_plugins == default_context_plugins
+
+
 def test_is_valid_dataset_name():
     bad_name = "ds-fee"
     with pytest.raises(ValueError) as exec_info:
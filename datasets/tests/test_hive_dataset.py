@@ -1,4 +1,5 @@
 from pathlib import Path
+from typing import List
 
 import dask.dataframe as dd
 import pandas as pd
@@ -6,6 +7,7 @@ import pytest
 from pandas._testing import assert_frame_equal
 from pyspark import pandas as ps
 from pyspark.sql import DataFrame as SparkDataFrame, SparkSession
+from pyspark.sql.functions import collect_list, collect_set, sort_array
 
 from datasets import Dataset, Mode
 from datasets.exceptions import InvalidOperationException
@@ -61,6 +63,12 @@ def df() -> pd.DataFrame:
     return pd.DataFrame(data)
 
 
+def _distinct_values(df: SparkDataFrame, *columns: str) -> List[list]:
+    # a single Spark aggregation instead of collecting the rows to pandas
+    row = df.agg(*[sort_array(collect_set(column)) for column in columns]).first()
+    return [list(values) for values in row]
+
+
 def test_dataset_factory_hive_plugin(dataset: HiveDataset, hive_table: str):
     assert dataset.name == "Foo"
     assert dataset.hive_table_name == hive_table
@@ -135,18 +143,14 @@ def test_hive_to_spark(dataset: HiveDataset, df: pd.DataFrame, spark_session: Sp
     spark_df = dataset.to_spark(columns="col1")
     assert spark_df.columns == ["col1", "run_id", "run_time"]
 
-    df1 = dataset.to_spark(partitions=dict(col1="A", col3="A1")).toPandas()
-    assert df1["col1"].unique().tolist() == ["A"]
-    assert df1["col3"].unique().tolist() == ["A1"]
+    df1 = dataset.to_spark(partitions=dict(col1="A", col3="A1"))
+    assert _distinct_values(df1, "col1", "col3") == [["A"], ["A1"]]
 
-    df2 = dataset.to_spark(partitions=dict(col1="A")).toPandas()
-    assert df2["col1"].unique().tolist() == ["A"]
-    assert df2["col3"].unique().tolist() == ["A1", "A2"]
+    df2 = dataset.to_spark(partitions=dict(col1="A"))
+    assert _distinct_values(df2, "col1", "col3") == [["A"], ["A1", "A2"]]
 
-    df3 = dataset.to_spark(partitions=dict(col1="C")).toPandas()
-    assert df3["col1"].unique().tolist() == ["C"]
-    assert sorted(df3["col2"].unique().tolist()) == [7, 8]
-    assert df3["col3"].unique().tolist() == ["C1"]
+    df3 = dataset.to_spark(partitions=dict(col1="C"))
+    assert _distinct_values(df3, "col1", "col2", "col3") == [["C"], [7, 8], ["C1"]]
 
     # write with a new run_time
     old_run_time = TestExecutor.test_run_time
@@ -219,20 +223,21 @@ def test_hive_write_existing_table(
 @pytest.mark.parametrize("hive_table", ["test_db.test_hive_to_spark_run_id"])
 @pytest.mark.parametrize("columns", ["col1,col2,col3,run_id"])
 @pytest.mark.spark
-def test_hive_to_spark_run_id(dataset: HiveDataset, df: pd.DataFrame, run_id: str, spark_session):
-    spark_session.sql("create database if not exists test_db")
-
+def test_hive_to_spark_run_id(dataset: HiveDataset, df: pd.DataFrame, run_id: str, hive_test_db: str):
     dataset.write(df)
 
     spark_df = dataset.to_spark(columns="col1,run_id")
     spark_df.show()
     assert spark_df.columns == ["col1", "run_id", "run_time"]
 
-    df1: pd.DataFrame = dataset.to_spark(partitions=dict(col1="A", col3="A1")).toPandas()
-    assert df1["col1"].unique().tolist() == ["A"]
-    assert df1["col2"].tolist() == list(range(1, 3))
-    assert df1["col3"].unique().tolist() == ["A1"]
-    assert df1["run_id"].unique().tolist() == [run_id]
+    df1: SparkDataFrame = dataset.to_spark(partitions=dict(col1="A", col3="A1"))
+    col1, col2, col3, run_ids = df1.agg(
+        collect_set("col1"), sort_array(collect_list("col2")), collect_set("col3"), collect_set("run_id")
+    ).first()
+    assert col1 == ["A"]
+    assert col2 == list(range(1, 3))
+    assert col3 == ["A1"]
+    assert run_ids == [run_id]
 
 
 def test_write_unsupported_data_frame(dataset: HiveDataset, df: pd.DataFrame):
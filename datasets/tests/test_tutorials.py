@@ -53,11 +53,15 @@ def test_hive_flow():
 
 
 def run_flow(flow_py, args: Optional[list] = None, context: Optional[str] = None) -> str:
-    os.environ["METAFLOW_COVERAGE_SOURCE"] = "tutorial,datasets"
-    os.environ["METAFLOW_COVERAGE_OMIT"] = "metaflow"
-    os.environ["METAFLOW_USER"] = "compile_only_user"
+    # a per-flow environment, so e.g. CONTEXT does not leak into later flows
+    env = dict(
+        os.environ,
+        METAFLOW_COVERAGE_SOURCE="tutorial,datasets",
+        METAFLOW_COVERAGE_OMIT="metaflow",
+        METAFLOW_USER="compile_only_user",
+    )
     if context:
-        os.environ["CONTEXT"] = context
+        env["CONTEXT"] = context
 
     base_dir = dirname(dirname(realpath(__file__)))
     file_name = os.path.join(base_dir, flow_py)
@@ -70,7 +74,7 @@ def run_flow(flow_py, args: Optional[list] = None, context: Optional[str] = None
     ]
     if args:
         cmd.extend(args)
-    process = run(cmd, cwd=dirname(base_dir), stdout=PIPE, stderr=STDOUT, encoding="utf8")
+    process = run(cmd, cwd=dirname(base_dir), env=env, stdout=PIPE, stderr=STDOUT, encoding="utf8")
     stdout = process.stdout
     if not process.returncode == 0:
         print(stdout)
@@ -39,9 +39,9 @@ class DefaultOnlineDatasetPlugin(DatasetPlugin):
         else:
             df = self._db
 
-        for meta_column in self._META_COLUMNS:
-            if meta_column in df and (read_columns is None or meta_column not in read_columns):
-                del df[meta_column]
+        meta_columns = self._get_meta_columns_to_drop(df.columns, read_columns)
+        if meta_columns:
+            df = df.drop(columns=meta_columns)
         return df
 
     def write(self, data: pd.DataFrame):
@@ -1,35 +1,23 @@
+import functools
 import keyword
+import re
+
+
+# ASCII, starts with an upper case letter, alphanumeric, and at least one lower case letter
+_UPPER_PASCAL_CASE = re.compile(r"[A-Z][A-Z0-9]*[a-z][A-Za-z0-9]*").fullmatch
+# ASCII, lower case letters, digits and underscores, starting with a letter and not ending with "_"
+_SNAKE_CASE = re.compile(r"[a-z](?:[a-z0-9_]*[a-z0-9])?").fullmatch
 
 
 def is_upper_pascal_case(name: str) -> bool:
-    is_valid: bool = (
-        name.isidentifier()
-        and name[0].isupper()
-        and name[0].isalpha()
-        and not keyword.iskeyword(name)
-        and name.isalnum()
-        and name.isascii()
-        and name != name.lower()
-        and name != name.upper()
-    )
-    return is_valid
+    return _UPPER_PASCAL_CASE(name) is not None and not keyword.iskeyword(name)
 
 
 def is_snake_case(name: str) -> bool:
-    is_valid: bool = (
-        name.isidentifier()
-        and name[0].islower()
-        and name[0].isalpha()
-        and not keyword.iskeyword(name)
-        and name.replace("_", "").isalnum()
-        and name.isascii()
-        and name == name.lower()
-        and name[0] != "_"
-        and name[-1] != "_"
-    )
-    return is_valid
+    return _SNAKE_CASE(name) is not None and not keyword.iskeyword(name)
 
 
+@functools.lru_cache(maxsize=1024)
 def pascal_to_snake_case(name: str) -> str:
     assert is_upper_pascal_case(name)
     snake = [f"_{c.lower()}" if c.isupper() or not c.isalpha() else c for c in name]
@@ -1,5 +1,5 @@
 import logging
-from os import listdir
+import os
 from pathlib import Path
 from typing import List, NamedTuple, Union
 
@@ -67,12 +67,10 @@ def get_path_partitions(
         ]
     else:
         # local test path
-        from pathlib import Path
-
         return [
             Partition(
                 name=x.split("=")[-1],
-                path=str(Path(data_path) / Path(x) / (Path(suffix) if suffix else Path())),
+                path=os.path.join(data_path, x, suffix) if suffix else os.path.join(data_path, x),
             )
-            for x in listdir(data_path)
+            for x in os.listdir(data_path)
         ]